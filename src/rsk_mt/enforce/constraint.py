@@ -44,13 +44,14 @@ def parse_yang_range(spec, min_, max_):
             return int(val)
     def parse_bound(string):
         """Return an integer bound parsed from `string`."""
+        if string == 'min':
+            return parse_int(min_)
+        if string == 'max':
+            return parse_int(max_)
         try:
             return parse_int(string)
         except (TypeError, ValueError):
-            if string == 'min':
-                return parse_int(min_)
-            if string == 'max':
-                return parse_int(max_)
+            pass
         raise ValueError(f'failed to parse YANG range bound from {string}')
     def parse_range(string):
         """Return a list with a single bound or pair of bounds from `string`."""
@@ -23,6 +23,7 @@ class ValueType():
     which are not commonly serializable. (Any value which cannot be directly
     encoded by :func:`json.dumps` is considered not commonly serializable.)
     """
+    __slots__ = ()
     def check(self, val): # pylint: disable=unused-argument,no-self-use
         """Check if the type of `val` is acceptable for a canonical value.
 
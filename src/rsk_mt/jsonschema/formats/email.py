@@ -17,6 +17,8 @@ import re
 from . import Format
 
 ATEXT = r'[\w\!\#\$\%\&\'\*\+\-\/\=\?\^\_\`\{\|\}\~]+'
+DOT_ATOM = ATEXT + r'(\.' + ATEXT + r')*'
+ADDR_SPEC = r'^' + DOT_ATOM + r'@' + DOT_ATOM + r'$'
 
 class Email(Format):
     """Semantic validation of `email`_ strings per `RFC 5322`_.
@@ -24,17 +26,12 @@ class Email(Format):
     Only `dot-atom` production is supported: no comments or folding whitespace.
     """
     name = 'email'
-    flags = re.ASCII
-    def __init__(self):
-        super().__init__()
-        dot_atom = ATEXT + r'(\.' + ATEXT + r')*'
-        rpattern = r'^' + dot_atom + r'@' + dot_atom + r'$'
-        self._regexp = re.compile(rpattern, self.flags)
+    regexp = re.compile(ADDR_SPEC, re.ASCII)
     def validates(self, primitive):
         return primitive == 'string'
     def __call__(self, val):
         try:
-            return bool(self._regexp.match(val))
+            return bool(self.regexp.match(val))
         except TypeError:
             return False
 
@@ -44,4 +41,4 @@ class IdnEmail(Email):
     Only `dot-atom` production is supported: no comments or folding whitespace.
     """
     name = 'idn-email'
-    flags = 0
+    regexp = re.compile(ADDR_SPEC)
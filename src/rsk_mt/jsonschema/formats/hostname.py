@@ -9,24 +9,33 @@
 """
 # pylint: enable=line-too-long
 
-import re
+from string import (ascii_letters, digits)
 
 from . import Format
 
+### octets allowed in a hostname: letters, digits, hyphen and the label dot
+LDH_DOT = (ascii_letters + digits + '-.').encode('ascii')
+
 class Hostname(Format):
     """Semantic validation of `hostname`_ strings per `RFC 1034`_."""
     name = 'hostname'
-    def __init__(self):
-        super().__init__()
-        label = r'([A-Za-z0-9]([A-Za-z0-9\-]{0,61}))?[A-Za-z0-9]'
-        dot = r'\.'
-        named = r'((' + label + dot + r')*' + r'(' + label + dot + r'?))'
-        root = dot
-        self._regexp = re.compile(r'^(' + named + r'|' + root + r')$')
     def validates(self, primitive):
         return primitive == 'string'
     def __call__(self, val):
         try:
-            return bool(self._regexp.match(val)) and len(val.rstrip('.')) <= 253
-        except TypeError:
+            octets = val.encode('ascii')
+        except (AttributeError, UnicodeEncodeError):
+            return False
+        if octets == b'.':
+            return True
+        if octets.endswith(b'.'):
+            octets = octets[:-1]
+        # deleting allowed octets in C leaves any disallowed octets behind
+        if not octets or len(octets) > 253 or octets.translate(None, LDH_DOT):
             return False
+        for label in octets.split(b'.'):
+            if not 0 < len(label) <= 63:
+                return False
+            if label.startswith(b'-') or label.endswith(b'-'):
+                return False
+        return True
@@ -13,19 +13,17 @@ import re
 
 from . import Format
 
+DECBYTE = r'([0-9]|[1-9][0-9]|1[0-9][0-9]|2[0-4][0-9]|25[0-5])'
+DOT = r'\.'
+
 class IPv4(Format):
     """Semantic validation of `ipv4`_ strings per `RFC 2673`_."""
     name = 'ipv4'
-    def __init__(self):
-        super().__init__()
-        decbyte = '([0-9]|[1-9][0-9]|1[0-9][0-9]|2[0-4][0-9]|25[0-5])'
-        dot = r'\.'
-        rpattern = r'^((' + decbyte + dot + r'){3}' + decbyte + r')$'
-        self._regexp = re.compile(rpattern)
+    regexp = re.compile(r'^((' + DECBYTE + DOT + r'){3}' + DECBYTE + r')$')
     def validates(self, primitive):
         return primitive == 'string'
     def __call__(self, val):
         try:
-            return bool(self._regexp.match(val))
+            return bool(self.regexp.match(val))
         except TypeError:
             return False
@@ -13,22 +13,21 @@ import re
 
 from . import Format
 
+IPV6_ADDRESS = r''.join((
+    r'((:|[0-9a-fA-F]{0,4}):)([0-9a-fA-F]{0,4}:){0,5}',
+    r'((([0-9a-fA-F]{0,4}:)?(:|[0-9a-fA-F]{0,4}))|',
+    r'(((25[0-5]|2[0-4][0-9]|[01]?[0-9]?[0-9])\.){3}',
+    r'(25[0-5]|2[0-4][0-9]|[01]?[0-9]?[0-9])))',
+))
+
 class IPv6(Format):
     """Semantic validation of `ipv6`_ strings per `RFC 2373`_."""
     name = 'ipv6'
-    def __init__(self):
-        super().__init__()
-        expr = r''.join((
-            r'((:|[0-9a-fA-F]{0,4}):)([0-9a-fA-F]{0,4}:){0,5}',
-            r'((([0-9a-fA-F]{0,4}:)?(:|[0-9a-fA-F]{0,4}))|',
-            r'(((25[0-5]|2[0-4][0-9]|[01]?[0-9]?[0-9])\.){3}',
-            r'(25[0-5]|2[0-4][0-9]|[01]?[0-9]?[0-9])))',
-        ))
-        self._regexp = re.compile(r'^' + expr + r'$')
+    regexp = re.compile(r'^' + IPV6_ADDRESS + r'$')
     def validates(self, primitive):
         return primitive == 'string'
     def __call__(self, val):
         try:
-            return bool(self._regexp.match(val))
+            return bool(self.regexp.match(val))
         except TypeError:
             return False
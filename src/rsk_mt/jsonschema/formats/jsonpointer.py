@@ -27,27 +27,23 @@ RELATIVE_JSON_POINTER = NON_NEGATIVE_INTEGER + r'(\#|' + JSON_POINTER + r')'
 class JsonPointer(Format):
     """Semantic validation of `json-pointer`_ strings per `RFC 6901`_."""
     name = 'json-pointer'
-    def __init__(self):
-        super().__init__()
-        self._regexp = re.compile(r'^' + JSON_POINTER + r'$')
+    regexp = re.compile(r'^' + JSON_POINTER + r'$')
     def validates(self, primitive):
         return primitive == 'string'
     def __call__(self, val):
         try:
-            return bool(self._regexp.match(val))
+            return bool(self.regexp.match(val))
         except TypeError:
             return False
 
 class RelativeJsonPointer(Format): # pylint: disable=too-few-public-methods
     """Semantic validation of `relative-json-pointer`_ strings per `draft`_."""
     name = 'relative-json-pointer'
-    def __init__(self):
-        super().__init__()
-        self._regexp = re.compile(r'^' + RELATIVE_JSON_POINTER + r'$')
+    regexp = re.compile(r'^' + RELATIVE_JSON_POINTER + r'$')
     def validates(self, primitive):
         return primitive == 'string'
     def __call__(self, val):
         try:
-            return bool(self._regexp.match(val))
+            return bool(self.regexp.match(val))
         except TypeError:
             return False
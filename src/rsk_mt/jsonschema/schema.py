@@ -734,6 +734,8 @@ class RootSchema(Schema):
         ): # pylint: disable=too-many-arguments
         self._support = support if support else Support()
         self._json_impl = json_impl
+        # classes built by Object validation, by schema URI
+        self._object_validator_classes = {}
         initial_base_uri = TYPE_ABSOLUTE_URI(initial_base_uri)
         Schema.__init__(self, self, spec, Identifiers(initial_base_uri))
         # mapping of URI or URI-encoded JSON Pointer to Schema instance
@@ -753,6 +755,10 @@ class RootSchema(Schema):
     def json_impl(self):
         """Return the JSON encoder/decoder implementation."""
         return self._json_impl
+    @property
+    def object_validator_classes(self):
+        """Return the dict of Object validation classes, by schema URI."""
+        return self._object_validator_classes
     def get_bases(self, uri):
         """Return base classes for validated value type specialisation.
 
@@ -6,6 +6,8 @@ from .validator import (
     Validator, TypeValidator,
     build_validators,
     equal,
+    memoise,
+    compile_pattern,
     TYPE_SCHEMA,
     TYPE_SCHEMA_SEQOF,
     TYPE_SCHEMA_ARRAY,
@@ -20,59 +20,46 @@
 
 from types import GeneratorType
 
-from rsk_mt.model import (ModelledDict, ModelledTuple, Model)
+from rsk_mt.model import (ModelledDict, ModelledTuple, SequenceModel)
 from . import (TYPE_SCHEMA, TYPE_SCHEMA_OR_SEQOF)
 from ..types import (TYPE_CORE, TYPE_NON_NEGATIVE_INTEGER)
 from . import (Validator, build_validators, equal)
 
-class ArrayModel(Validator, Model):
+class ArrayModel(Validator, SequenceModel):
     """A sequence model and |Validator| enforcing a JSON Schema array model.
 
     The JSON Schema array model is specified by `model_spec` and `policy_spec`.
     """
     def __init__(self, model_spec, policy_spec):
-        self._head_keyword = self._head = None
-        self._tail_keyword = self._tail = None
-        self._cont_keyword = self._cont = None
+        # model attributes are set by _define, called by Model.__init__
+        # (`model_spec` is always supplied)
         Validator.__init__(self, model_spec['schema'])
-        Model.__init__(self, model_spec, policy_spec)
-    def _define(self):
+        SequenceModel.__init__(self, model_spec, policy_spec)
+    def _define(self): # pylint: disable=attribute-defined-outside-init
         (self._head_keyword, self._head) = self._model_spec['head']
         (self._tail_keyword, self._tail) = self._model_spec['tail']
         (self._cont_keyword, self._cont) = self._model_spec['cont']
         self.validators = self._model_spec['validators']
+        # head, contains and validators need the whole array up front;
+        # otherwise an array can be formed in a single pass over its items
+        self._random_access = bool(
+            self._head or self._cont or self._validators
+        )
+        self._build_form_tail()
     def check(self, val):
         return isinstance(val, (list, tuple, GeneratorType))
     def __call__(self, val):
         if not self.check(val):
             raise TypeError(val)
         if isinstance(val, GeneratorType):
-            val = tuple(val)
+            if not self._random_access:
+                return self._form_tail([], val)
+            val = list(val)
         val = super().__call__(val)
-        if self._cont and not any(self._cont.validate(item) for item in val):
+        if self._cont and not any(map(self._cont.validate, val)):
             raise ValueError(val)
-        formed = []
-        idx = 0
-        while idx < len(val):
-            try:
-                item = val[idx]
-                item = self._head[idx](item)
-            except IndexError:
-                break
-            else:
-                formed.append(item)
-            idx += 1
-        while idx < len(val):
-            item = val[idx]
-            if self._tail is not None:
-                formed.append(self._tail(item))
-            elif self._policy_spec == 'must-understand':
-                raise ValueError(item)
-            elif self._policy_spec == 'must-accept':
-                formed.append(item)
-            ### else self._policy_spec == 'must-ignore' => discard
-            idx += 1
-        return formed
+        formed = [head(item) for (head, item) in zip(self._head, val)]
+        return self._form_tail(formed, val[len(formed):])
     def debug(self, val, results):
         if not self.check(val):
             return False
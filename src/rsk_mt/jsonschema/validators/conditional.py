@@ -8,8 +8,10 @@
 """
 # pylint: enable=line-too-long
 
+from functools import partial
+
 from rsk_mt.model import ModelledDict
-from . import (Validator, TYPE_SCHEMA)
+from . import (Validator, TYPE_SCHEMA, memoise)
 
 class ConditionalValidator(Validator):
     """A |Validator| implementing `conditional`_ validation.
@@ -23,15 +25,23 @@ class ConditionalValidator(Validator):
         self.if_schema = if_schema
         self.then_schema = then_schema
         self.else_schema = else_schema
+        # memoise a function of the subschemas only, not a method bound to self
+        self._memo_enforce = memoise(partial(
+            self._enforce, if_schema, then_schema, else_schema,
+        ))
     def __call__(self, val):
+        return self._memo_enforce(val)
+    @staticmethod
+    def _enforce(if_schema, then_schema, else_schema, val):
+        """Enforce `conditional`_ validation of `val` by the subschemas."""
         try:
-            val = self.if_schema(val)
+            val = if_schema(val)
         except (TypeError, ValueError):
-            if self.else_schema:
-                val = self.else_schema(val)
+            if else_schema:
+                val = else_schema(val)
         else:
-            if self.then_schema:
-                val = self.then_schema(val)
+            if then_schema:
+                val = then_schema(val)
         return val
     def debug(self, val, results):
         valid = self.if_schema.debug(val, results)
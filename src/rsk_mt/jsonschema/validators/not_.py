@@ -8,8 +8,10 @@
 """
 # pylint: enable=line-too-long
 
+from functools import partial
+
 from rsk_mt.model import ModelledDict
-from . import (Validator, TYPE_SCHEMA)
+from . import (Validator, TYPE_SCHEMA, memoise)
 
 class NotValidator(Validator):
     """A |Validator| implementing `not`_ validation.
@@ -21,15 +23,21 @@ class NotValidator(Validator):
         Validator.__init__(self, schema)
         self._keyword = keyword
         self._not_schema = not_schema
+        # memoise a function of the subschema only, not a method bound to self
+        self._memo_enforce = memoise(partial(self._enforce, not_schema))
     def __call__(self, val):
+        return self._memo_enforce(val)
+    @staticmethod
+    def _enforce(not_schema, val):
+        """Enforce `not`_ validation of `val` by `not_schema`."""
         try:
-            self._not_schema(val)
+            not_schema(val)
         except (TypeError, ValueError):
             return val
         else:
             raise ValueError(val)
     def debug(self, val, results):
-        valid = True ^ bool(self._not_schema.debug(val, results))
+        valid = not self._not_schema.debug(val, results)
         results.assertion(self._schema, self._keyword, valid)
         return valid
 
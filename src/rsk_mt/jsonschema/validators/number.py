@@ -14,6 +14,9 @@
 """
 # pylint: enable=line-too-long
 
+from functools import partial
+from operator import (lt, le, gt, ge)
+
 from rsk_mt.model import ModelledDict
 from ..types import (TYPE_CORE, TYPE_POSITIVE_NUMBER)
 from . import TypeValidator
@@ -54,10 +57,11 @@ def validator(validation, root, schema):
     return TypeValidator.build(root, schema, validation, (
         # pylint: disable=undefined-variable
         ('multipleOf', lambda div: lambda val: int(val/div) == val/div),
-        ('maximum', lambda max_: lambda val: val <= max_),
-        ('exclusiveMaximum', lambda emax: lambda val: val < emax),
-        ('minimum', lambda min_: lambda val: min_ <= val),
-        ('exclusiveMinimum', lambda emin: lambda val: emin < val),
+        # bound comparisons, e.g. ge(max_, val) is max_ >= val is val <= max_
+        ('maximum', lambda max_: partial(ge, max_)),
+        ('exclusiveMaximum', lambda emax: partial(gt, emax)),
+        ('minimum', lambda min_: partial(le, min_)),
+        ('exclusiveMinimum', lambda emin: partial(lt, emin)),
     ))
 
 class Integer(metaclass=ModelledDict): # pylint: disable=too-few-public-methods
@@ -30,7 +30,7 @@ from rsk_mt.enforce.value import (Choice, SequenceOf)
 from rsk_mt.model import (MappingModel, ModelledDict)
 from . import TYPE_SCHEMA
 from ..types import (TYPE_CORE, TYPE_NON_NEGATIVE_INTEGER)
-from . import (Validator, build_validators)
+from . import (Validator, build_validators, compile_pattern, memoise)
 
 TYPE_DEPENDENCIES = Choice((
     TYPE_SCHEMA,
@@ -39,6 +39,24 @@ TYPE_DEPENDENCIES = Choice((
 
 # pylint: disable=unsubscriptable-object
 
+def build_pattern_union(regexps):
+    """Build a regular expression matching if any of `regexps` match.
+
+    Return a compiled regular expression which finds a match in a string if and
+    only if any compiled regular expression in `regexps` does. Return None if
+    there are fewer than two `regexps`, or if they cannot be safely combined
+    (because they contain groups, which could be referred to by number, or
+    flags, which must only appear at the start of a regular expression).
+    """
+    if len(regexps) < 2 or any(regexp.groups for regexp in regexps):
+        return None
+    try:
+        return re.compile('|'.join(
+            f'(?:{regexp.pattern})' for regexp in regexps
+        ))
+    except re.error:
+        return None
+
 class ObjectModel(Validator, MappingModel):
     """An object model and |Validator| enforcing a JSON Schema object model.
 
@@ -48,36 +66,117 @@ class ObjectModel(Validator, MappingModel):
     def __init__(self, model_spec, policy_spec):
         self._mandatory = None
         self._is_mandatory = None
-        self._ge_min = None
-        self._le_max = None
+        self._min_props = None
+        self._max_props = None
         self._properties = None
         self._pattern_properties = None
+        self._pattern_union = None
+        self._pattern_items = None
         self._additional_properties = None
         self._property_names = None
         self._dep_instance = None
         self._dep_presence = None
         self._dependencies = None
+        self._enforce = None
         Validator.__init__(self, model_spec['schema'])
         MappingModel.__init__(self, model_spec, policy_spec)
     def _define(self):
         self.validators = self._model_spec['validators']
         self._mandatory = frozenset(self._model_spec['required'])
         self._is_mandatory = lambda key: key in self._mandatory
-        self._ge_min = self.get_validator(
-            'minProperties',
-            lambda val, dec: True,
-        )
-        self._le_max = self.get_validator(
-            'maxProperties',
-            lambda val, inc: True,
-        )
+        # None when there is no minProperties/maxProperties limit
+        self._min_props = self._model_spec['minProperties']
+        self._max_props = self._model_spec['maxProperties']
         self._properties = self._model_spec['properties']
         self._pattern_properties = self._model_spec['patternProperties']
+        self._pattern_union = build_pattern_union(
+            tuple(self._pattern_properties),
+        )
+        self._pattern_items = tuple(self._pattern_properties.items())
         self._additional_properties = self._model_spec['additionalProperties']
         self._property_names = self._model_spec['propertyNames']
+        if self._property_names is not None:
+            # the same keys are commonly seen again: remember their outcomes
+            self._property_names = memoise(self._property_names)
         self._dep_instance = self._model_spec['dependencies']['instance']
         self._dep_presence = self._model_spec['dependencies']['presence']
         self._dependencies = self._dep_instance or self._dep_presence
+        self._enforce = self._build_enforce()
+    def _pattern_schemas(self, key):
+        """Yield the pattern properties schemas with a regexp hit on `key`."""
+        if self._pattern_union is None or self._pattern_union.search(key):
+            for regexp in self._pattern_properties:
+                if regexp.search(key):
+                    yield self._pattern_properties[regexp]
+    def _build_enforce(self):
+        """Build a function enforcing this model on a :class:`dict` value.
+
+        The function closes over the model definition, so that enforcing a value
+        does not repeatedly look up model attributes or call :meth:`form_pair`.
+        """
+        validators = self._validator_funcs
+        properties = self._properties
+        pattern_properties = self._pattern_items
+        pattern_union = self._pattern_union
+        additional_properties = self._additional_properties
+        property_names = self._property_names
+        dep_instance = self._dep_instance
+        dep_presence = self._dep_presence
+        if property_names is None and not (
+                pattern_properties or self._dependencies
+            ):
+            # the common case of a model without pattern properties, property
+            # names or dependencies: each pair is formed by a single schema
+            def enforce_simple(val):
+                """Return a :class:`dict` value formed from dict `val`."""
+                for func in validators:
+                    if not func(val):
+                        raise ValueError(val)
+                formed = {}
+                for (key, item) in val.items():
+                    try:
+                        if key in properties:
+                            item = properties[key](item)
+                        elif additional_properties:
+                            item = additional_properties(item)
+                    except KeyError:
+                        raise ValueError(val) from None
+                    formed[key] = item
+                return formed
+            return enforce_simple
+        def enforce(val):
+            """Return a :class:`dict` value formed from dict `val`."""
+            for func in validators:
+                if not func(val):
+                    raise ValueError(val)
+            formed = {}
+            for (key, item) in val.items():
+                try:
+                    if key in properties:
+                        schema = properties[key]
+                        item = schema(item)
+                    else:
+                        schema = None
+                    if pattern_union is None or pattern_union.search(key):
+                        for (regexp, p_schema) in pattern_properties:
+                            if regexp.search(key):
+                                schema = p_schema
+                                item = schema(item)
+                    if schema is None and additional_properties:
+                        item = additional_properties(item)
+                    if property_names is not None:
+                        key = property_names(key)
+                except KeyError:
+                    raise ValueError(val) from None
+                formed[key] = item
+            fkeys = formed.keys()
+            for key in fkeys & dep_instance.keys():
+                dep_instance[key](formed)
+            for key in fkeys & dep_presence.keys():
+                if dep_presence[key] - fkeys:
+                    raise ValueError(val)
+            return formed
+        return enforce
     def invalid(self, initial, other=None, key=None):
         """A boolean function for testing whether an update is invalid or not.
 
@@ -96,6 +195,32 @@ class ObjectModel(Validator, MappingModel):
             return True
         else:
             return False
+    def _invalid_formed(self, initial, other=None, key=None):
+        """A boolean function for testing whether an update is invalid or not.
+
+        As :meth:`invalid`, except that the pairs in `initial` and `other` must
+        already be formed according to this model. Only the rules applying to
+        the whole updated value (value validators and dependencies) are
+        enforced; pairs are not formed again.
+        """
+        val = dict(initial)
+        if other is not None:
+            val.update(other)
+        if key is not None:
+            del val[key]
+        for func in self._validators.values():
+            if not func(val):
+                return True
+        for key_ in val:
+            if key_ in self._dep_instance:
+                try:
+                    self._dep_instance[key_](val)
+                except (TypeError, ValueError):
+                    return True
+            if key_ in self._dep_presence:
+                if self._dep_presence[key_] - val.keys():
+                    return True
+        return False
     def form_pair(self, key, val):
         """Form a pair from `key`, `val` according to the rules of this model.
 
@@ -103,78 +228,81 @@ class ObjectModel(Validator, MappingModel):
         Raise |TypeError| or |ValueError| if the model cannot accept `val`.
         Raise |KeyError| for any other error reason.
         """
+        properties = self._properties
+        pattern_union = self._pattern_union
+        additional_properties = self._additional_properties
+        property_names = self._property_names
         ### enforce `val`...
         ### ...using properties schema at `key`
-        try:
-            schema = self._properties[key]
-        except KeyError:
-            schema = None
-        else:
+        if key in properties:
+            schema = properties[key]
             val = schema(val)
+        else:
+            schema = None
         ### ...using all pattern properties with a regexp hit on `key`
-        for regexp in self._pattern_properties:
-            if regexp.search(key):
-                schema = self._pattern_properties[regexp]
-                val = schema(val)
+        if pattern_union is None or pattern_union.search(key):
+            for (regexp, p_schema) in self._pattern_items:
+                if regexp.search(key):
+                    schema = p_schema
+                    val = schema(val)
         ### ...otherwise additional properties
         if schema is None:
-            if self._additional_properties:
-                val = self._additional_properties(val)
+            if additional_properties:
+                val = additional_properties(val)
         ### enforce `key`
-        if self._property_names is None:
+        if property_names is None:
             return (key, val)
         try:
-            return (self._property_names(key), val)
+            return (property_names(key), val)
         except (KeyError, ValueError):
             # pylint: disable=raise-missing-from
             raise KeyError(key)
     def default_value(self, key):
         ### prefer default value in properties schema at `key`
-        try:
-            return self._properties[key].default
-        except KeyError:
-            pass
+        if key in self._properties:
+            try:
+                return self._properties[key].default
+            except KeyError:
+                pass
         ### only accept a single matching pattern properties default
         ### multiple matching pattern properties defaults is an error
         ### (no method to select winner)
         defaults = []
-        for regexp in self._pattern_properties:
-            if regexp.search(key):
-                schema = self._pattern_properties[regexp]
-                try:
-                    defaults.append(schema.default)
-                except KeyError:
-                    pass
-                else:
-                    if len(defaults) > 1:
-                        raise KeyError(key)
-        try:
+        for schema in self._pattern_schemas(key):
+            try:
+                defaults.append(schema.default)
+            except KeyError:
+                pass
+            else:
+                if len(defaults) > 1:
+                    raise KeyError(key)
+        if defaults:
             return defaults[0]
-        except IndexError:
-            pass
         ### last resort is any additionalProperties default
         if self._additional_properties:
             return self._additional_properties.default
         raise KeyError(key)
     def screen_setitem(self, mapping, key, val):
         pair = self.form_pair(key, val)
-        if not self._le_max(mapping, 1):
+        max_props = self._max_props
+        if max_props is not None and max_props < len(mapping) + 1:
             raise KeyError(key)
-        if self._dependencies and self.invalid(mapping, (pair,)):
+        if self._dependencies and self._invalid_formed(mapping, (pair,)):
             raise KeyError(key)
         return pair
     def screen_moditem(self, mapping, key, val):
         pair = self.form_pair(key, val)
-        if self._dependencies and self.invalid(mapping, (pair,)):
+        if self._dependencies and self._invalid_formed(mapping, (pair,)):
             raise KeyError(key)
         return pair
     def screen_delitem(self, mapping, key):
         if key in mapping:
             if self._is_mandatory(key):
                 raise KeyError(key)
-            if not self._ge_min(mapping, 1):
+            min_props = self._min_props
+            if min_props is not None and len(mapping) - 1 < min_props:
                 raise KeyError(key)
-            if self._dependencies and self.invalid(mapping, None, key):
+            if self._dependencies and self._invalid_formed(mapping, None, key):
                 raise KeyError(key)
         return key
     def screen_update(self, mapping, other):
@@ -187,17 +315,18 @@ class ObjectModel(Validator, MappingModel):
                 raise ValueError(other)
             else:
                 formed[pair[0]] = pair[1]
-        if not self._le_max(
-                mapping,
-                len(frozenset(formed) - frozenset(mapping)),
+        max_props = self._max_props
+        if max_props is not None and max_props < len(mapping) + len(
+                formed.keys() - mapping.keys()
             ):
             raise ValueError(other)
-        if self._dependencies and self.invalid(mapping, other):
+        if self._dependencies and self._invalid_formed(mapping, formed):
             raise ValueError(other)
         return formed
     def pairs_free(self, mapping):
-        free = set(mapping) - self._mandatory
-        if not self._ge_min(mapping, len(free)):
+        free = mapping.keys() - self._mandatory
+        min_props = self._min_props
+        if min_props is not None and len(mapping) - len(free) < min_props:
             free = set()
         elif self._dependencies:
             free = set()
@@ -210,35 +339,13 @@ class ObjectModel(Validator, MappingModel):
         Raise |TypeError| or |ValueError| if `val` does not conform to this
         instance's model and policy.
         """
-        if not self.check(val):
-            raise TypeError(val)
-        if isinstance(val, GeneratorType):
+        # the value must be a dict or a generator of pairs: a dict cannot be
+        # blindly constructed from `val`, which would accept arrays of pairs
+        if not isinstance(val, dict):
+            if not isinstance(val, GeneratorType):
+                raise TypeError(val)
             val = dict(val)
-        val = super().__call__(val)
-        formed = {}
-        for key in val:
-            try:
-                pair = self.form_pair(key, val[key])
-            except KeyError:
-                raise ValueError(val) # pylint: disable=raise-missing-from
-            else:
-                formed[pair[0]] = pair[1]
-        if self._dep_instance:
-            for key in formed:
-                try:
-                    schema = self._dep_instance[key]
-                except KeyError:
-                    pass
-                else:
-                    schema(formed)
-        if self._dep_presence:
-            for key in formed:
-                try:
-                    if self._dep_presence[key] - formed.keys():
-                        raise ValueError(val)
-                except KeyError:
-                    pass
-        return formed
+        return self._enforce(val)
     def debug(self, val, results):
         def debug_val(valid, key, schema, val):
             """Update `valid` result at `key` with `schema` debug of `val`."""
@@ -252,36 +359,24 @@ class ObjectModel(Validator, MappingModel):
         for key in val:
             results.key_path_push(key)
             schema = None
-            try:
+            if key in self._properties:
                 schema = self._properties[key]
-            except KeyError:
-                pass
-            else:
                 debug_val(k_valid, 'properties', schema, val[key])
-            for regexp in self._pattern_properties:
-                if regexp.search(key):
-                    schema = self._pattern_properties[regexp]
-                    debug_val(k_valid, 'patternProperties', schema, val[key])
+            for schema in self._pattern_schemas(key):
+                debug_val(k_valid, 'patternProperties', schema, val[key])
             if schema is None:
                 if self._additional_properties:
                     schema = self._additional_properties
                     debug_val(k_valid, 'additionalProperties', schema, val[key])
             results.key_path_pop()
-            try:
+            if key in self._dep_instance:
                 schema = self._dep_instance[key]
-            except KeyError:
-                pass
-            else:
                 debug_val(k_valid, 'dependencies', schema, val)
-            try:
+            if key in self._dep_presence:
                 d_valid = not self._dep_presence[key] - val.keys()
-            except KeyError:
-                pass
-            else:
-                try:
-                    k_valid['dependencies'] = k_valid['dependencies'] and d_valid
-                except KeyError:
-                    k_valid['dependencies'] = d_valid
+                k_valid['dependencies'] = d_valid and (
+                    k_valid.get('dependencies', True)
+                )
         for keyword in k_valid:
             results.assertion(self._schema, keyword, k_valid[keyword])
             valid = valid and k_valid[keyword]
@@ -296,7 +391,8 @@ def build_validator_required(required):
     required = frozenset(required)
     if not required:
         return None
-    return lambda val: not (required - frozenset(val.keys()))
+    count = len(required)
+    return lambda val: count <= len(val) and required <= val.keys()
 
 class Object(metaclass=ModelledDict):
     """JSON Schema `object`_ type validation."""
@@ -372,14 +468,8 @@ class Object(metaclass=ModelledDict):
             'schema': schema,
             'validators': build_validators(root, self, (
                 # pylint: disable=undefined-variable
-                (
-                    'minProperties',
-                    lambda min_: lambda val, dec=0: min_ <= (len(val) - dec),
-                ),
-                (
-                    'maxProperties',
-                    lambda max_: lambda val, inc=0: (len(val) + inc) <= max_
-                ),
+                ('minProperties', lambda min_: lambda val: min_ <= len(val)),
+                ('maxProperties', lambda max_: lambda val: len(val) <= max_),
                 (
                     'required',
                     build_validator_required,
@@ -393,7 +483,7 @@ class Object(metaclass=ModelledDict):
                 for k in self['properties']
             },
             'patternProperties': {
-                re.compile(k): self._subschema(
+                compile_pattern(k): self._subschema(
                     root, schema, 'patternProperties', k,
                 ) for k in self['patternProperties']
             },
@@ -409,7 +499,7 @@ class Object(metaclass=ModelledDict):
                     )
                 },
                 'presence': {
-                    k: v
+                    k: frozenset(v)
                     for k, v in self['dependencies'].items() if isinstance(
                         v, list,
                     )
@@ -428,8 +518,13 @@ class Object(metaclass=ModelledDict):
         `object`_ validation rules in |Schema| `schema` under |RootSchema|
         `root`. When validation is successful, a class instance created from the
         accepted value is returned in place of the accepted value. That instance
-        also implements custom base classes in `root` for `schema`.
+        also implements custom base classes in `root` for `schema`. The class
+        is built once for `schema` under `root` and is then reused.
         """
+        # classes are kept by `root`, so that they die with it
+        classes = root.object_validator_classes
+        if schema.uri in classes:
+            return classes[schema.uri]
         bases = root.get_bases(schema.uri)
         model, policy = self.model_and_policy(root, schema)
         body = {
@@ -446,4 +541,5 @@ class Object(metaclass=ModelledDict):
                 lambda cls, val, results: cls.model.debug(val, results)
             ),
         }
-        return ModelledDict(schema.uri, bases, body)
+        classes[schema.uri] = ModelledDict(schema.uri, bases, body)
+        return classes[schema.uri]
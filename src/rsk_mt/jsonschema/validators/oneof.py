@@ -8,9 +8,31 @@
 """
 # pylint: enable=line-too-long
 
+from types import GeneratorType
+
 from rsk_mt.model import ModelledDict
+from ..types import TYPE_CORE
 from . import (Validator, TYPE_SCHEMA_ARRAY)
 
+def schema_types(schema):
+    """Return the primitive types which `schema` can accept.
+
+    Return a frozenset of primitive type names if `schema` only accepts values
+    of those types, according to its `type` keyword. Return None if `schema`
+    may accept values of any type: it has no `type` keyword, it is a `$ref`
+    reference or its implementation is optimised by application support.
+    """
+    spec = getattr(schema, 'spec', None)
+    if not isinstance(spec, dict) or '$ref' in spec or 'type' not in spec:
+        return None
+    types = spec['type']
+    types = frozenset((types,) if isinstance(types, str) else types)
+    if types - frozenset(TYPE_CORE):
+        return None
+    if schema.root.get_optimised(schema.uri):
+        return None
+    return types
+
 class OneOfValidator(Validator):
     """A |Validator| implementing `oneOf`_ validation.
 
@@ -21,10 +43,29 @@ class OneOfValidator(Validator):
         Validator.__init__(self, schema)
         self._keyword = keyword
         self._schemas = schemas
+        self._types = tuple(schema_types(schema) for schema in schemas)
+        # the schemas which may accept values of a class, by class
+        self._by_class = {}
+    def candidates(self, val):
+        """Return the schemas which may accept `val`, judged by its type."""
+        cls = val.__class__
+        if cls is GeneratorType:
+            # a generator may be enforced as either an array or an object
+            return self._schemas
+        schemas = self._by_class.get(cls)
+        if schemas is None:
+            # primitive type checks depend only on the class of `val`
+            schemas = self._by_class[cls] = tuple(
+                schema for (schema, types) in zip(self._schemas, self._types)
+                if types is None or any(
+                    TYPE_CORE[type_].check(val) for type_ in types
+                )
+            )
+        return schemas
     def __call__(self, val):
         accepted = None
         valid = 0
-        for schema in self._schemas:
+        for schema in self.candidates(val):
             try:
                 accepted = schema(val)
             except (TypeError, ValueError):
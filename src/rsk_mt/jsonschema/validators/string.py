@@ -11,14 +11,24 @@
 """
 # pylint: enable=line-too-long
 
-import re
+from functools import lru_cache
 
 from rsk_mt.model import ModelledDict
 from ..types import (TYPE_NON_NEGATIVE_INTEGER, TYPE_CORE)
-from . import TypeValidator
+from . import (TypeValidator, compile_pattern)
 
 # pylint: disable=unsubscriptable-object
 
+@lru_cache(maxsize=4096)
+def build_validator_pattern(pattern):
+    """Build a pattern validator function.
+
+    Return a boolean function for testing whether a string value matches regex
+    `pattern`. The function is shared by all schemas using `pattern`.
+    """
+    regexp = compile_pattern(pattern)
+    return lambda val: regexp.search(val) is not None
+
 class String(metaclass=ModelledDict): # pylint: disable=too-few-public-methods
     """JSON Schema `string`_ type validation."""
     model = {
@@ -49,14 +59,6 @@ class String(metaclass=ModelledDict): # pylint: disable=too-few-public-methods
         The |Validator| instance must only accept values passing the `string`_
         validation rules in |Schema| `schema` under |RootSchema| `root`.
         """
-        def build_validator_pattern(pattern):
-            """Build a pattern validator function.
-
-            Return a boolean function for testing whether a string value matches
-            regex `pattern`.
-            """
-            regexp = re.compile(pattern)
-            return lambda val: regexp.search(val) is not None
         return TypeValidator.build(root, schema, self, (
             # pylint: disable=undefined-variable
             ('maxLength', lambda max_: lambda val: len(val) <= max_),
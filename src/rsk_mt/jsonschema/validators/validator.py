@@ -3,6 +3,7 @@
 # pylint: disable=line-too-long
 """`JSON Schema Validation`_ validator implementation.
 
+   .. |TypeError| replace:: :class:`TypeError`
    .. |ValueError| replace:: :class:`ValueError`
    .. |RootSchema| replace:: :class:`RootSchema <rsk_mt.jsonschema.schema.RootSchema>`
    .. |Schema| replace:: :class:`Schema <rsk_mt.jsonschema.schema.Schema>`
@@ -16,6 +17,9 @@
 """
 # pylint: enable=line-too-long
 
+from functools import lru_cache
+import re
+
 from rsk_mt.enforce.value import (ValueType, Constrained, Choice, SequenceOf)
 from rsk_mt.enforce.constraint import Length
 from ..types import TYPE_CORE
@@ -63,6 +67,53 @@ def _build_validator_encoding(root, validation):
         func = root.get_encoding(name)
     return (keyword, func) if func and primitive == 'string' else None
 
+@lru_cache(maxsize=4096)
+def compile_pattern(pattern):
+    """Return a compiled regular expression for string `pattern`.
+
+    Compiled regular expressions are shared by all schemas using `pattern`.
+    """
+    return re.compile(pattern)
+
+### scalar value types whose values can be memoised by (type, value)
+### (not float: 0.0 and -0.0 are equal but distinct values)
+_MEMO_TYPES = frozenset((str, int, bool, type(None)))
+
+def memoise(func, maxsize=256):
+    """Return a memoising wrapper of value validation function `func`.
+
+    The wrapper remembers the outcome of calling `func` with up to `maxsize`
+    scalar values. A value is remembered by its type and value, so that equal
+    values of different types (such as 1 and True) are not confused. Values of
+    other types, such as floats, dicts and lists, are always passed on to
+    `func`. If `func` raises |TypeError| or |ValueError|, then that exception is
+    raised; for a remembered value, an exception of the same type and with the
+    same arguments is raised again.
+    """
+    cache = {}
+    def wrapper(val):
+        """Return the memoised outcome of `func` for `val`."""
+        if val.__class__ not in _MEMO_TYPES:
+            return func(val)
+        key = (val.__class__, val)
+        try:
+            (accepted, result) = cache[key]
+        except KeyError:
+            if len(cache) >= maxsize:
+                del cache[next(iter(cache))]
+            try:
+                result = func(val)
+            except (TypeError, ValueError) as err:
+                cache[key] = (False, (err.__class__, err.args))
+                raise
+            cache[key] = (True, result)
+            return result
+        if accepted:
+            return result
+        (err_cls, err_args) = result
+        raise err_cls(*err_args)
+    return wrapper
+
 def build_validators(root, validation, build_pairs):
     """Build a list of value validator (keyword, function) pairs.
 
@@ -97,27 +148,27 @@ class Validator(ValueType):
     def __init__(self, schema):
         ValueType.__init__(self)
         self._schema = schema
-        self._validators = ()
+        # value validator functions by keyword, in validation order
+        self._validators = {}
+        # value validator functions only, for enforcement
+        self._validator_funcs = ()
     @property
     def validators(self):
         """Yield this instance's value validator pairs."""
-        for pair in self._validators:
-            yield pair
+        yield from self._validators.items()
     @validators.setter
     def validators(self, pairs):
         """Set this instance's value validator pairs."""
-        self._validators = pairs
+        self._validators = dict(pairs)
+        self._validator_funcs = tuple(self._validators.values())
     def get_validator(self, keyword, default=None):
         """Get this instance's value validator function for `keyword`.
 
         Return `default` if there is no value validator pair for `keyword`.
         """
-        for (v_keyword, func) in self.validators:
-            if v_keyword == keyword:
-                return func
-        return default
+        return self._validators.get(keyword, default)
     def __call__(self, val):
-        for (_keyword, func) in self.validators:
+        for func in self._validator_funcs:
             if not func(val):
                 raise ValueError(val)
         return val
@@ -127,7 +178,7 @@ class Validator(ValueType):
         Also record the outcome of each keyword assertion in `results`.
         """
         valid = True
-        for (keyword, func) in self.validators:
+        for (keyword, func) in self._validators.items():
             f_valid = func(val)
             results.assertion(self._schema, keyword, f_valid)
             valid = f_valid and valid
@@ -165,20 +216,32 @@ class TypeValidator(Validator):
 
 def equal(val1, val2):
     """A boolean function testing equality of `primitive`_ values."""
-    if val1 is val2:
-        return True
-    if val1 == val2:
+    # compare pairs of values from a stack, rather than recursing into
+    # structured values, so that deeply nested values can be compared
+    pairs = [(val1, val2)]
+    while pairs:
+        (val1, val2) = pairs.pop()
+        if val1 is val2:
+            continue
         if isinstance(val1, (float, int)) and isinstance(val2, (float, int)):
             # if numeric, both values must be numeric or both must be boolean
-            if not isinstance(val1, bool) ^ isinstance(val2, bool):
-                return True
-        elif isinstance(val1, type(val2)) and isinstance(val2, type(val1)):
+            if val1 != val2 or isinstance(val1, bool) ^ isinstance(val2, bool):
+                return False
+        elif not (
+                isinstance(val1, type(val2)) and isinstance(val2, type(val1))
+            ):
             # otherwise both values must be of the same type
+            return False
+        elif isinstance(val1, dict):
             # and values in structured values must also satisfy equality
             # constraints
-            if isinstance(val1, dict):
-                return all(equal(val1[k], val2[k]) for k in val1)
-            if isinstance(val1, (list, tuple)):
-                return all(equal(val1[i], val2[i]) for i in range(len(val1)))
-            return True
-    return False
+            if val1.keys() != val2.keys():
+                return False
+            pairs.extend((val1[k], val2[k]) for k in val1)
+        elif isinstance(val1, (list, tuple)):
+            if len(val1) != len(val2):
+                return False
+            pairs.extend(zip(val1, val2))
+        elif val1 != val2:
+            return False
+    return True
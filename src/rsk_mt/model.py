@@ -44,6 +44,10 @@ constraints.
 .. |AlreadyDefinedError| replace:: :class:`AlreadyDefinedError`
 """
 
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+
 from rsk_mt.enforce.value import (
     ValueType,
     Any,
@@ -56,6 +60,18 @@ POLICY = Enum((
     'must-accept',
 ))
 
+### the default pair value type: Any is stateless, so one instance is shared
+_ANY = Any()
+
+### small integer codes for POLICY values, for branching on in hot paths and
+### for validating a policy with a single lookup
+(_MUST_UNDERSTAND, _MUST_IGNORE, _MUST_ACCEPT) = range(3)
+_POLICY_CODES = {
+    'must-understand': _MUST_UNDERSTAND,
+    'must-ignore': _MUST_IGNORE,
+    'must-accept': _MUST_ACCEPT,
+}
+
 class NotDefinedError(Exception):
     """An exception indicating a type model is not yet defined.
 
@@ -100,6 +116,11 @@ def _modelled_init_mutable(bases, body):
     __init__ method for each other base in `bases` is called. (No value is
     supplied to these subsequent calls.)
     """
+    base_init = bases[0].__init__
+    # class-specific initialisation, or other bases initialisation
+    inits = (body['__init__'],) if '__init__' in body else tuple(
+        base.__init__ for base in bases[1:]
+    )
     def init(self, val=()):
         """Initialise `self`, a specialised class instance, from `val`."""
         try:
@@ -107,24 +128,22 @@ def _modelled_init_mutable(bases, body):
         except NotDefinedError as err:
             raise NotDefinedError(self.__class__) from err
         # init the type that is being specialised with `val`
-        bases[0].__init__(self, val)
+        base_init(self, val)
         # init other bases
-        if '__init__' in body:
-            # class-specific initialisation
-            body['__init__'](self)
-        else:
-            # other bases initialisation
-            for base in bases[1:]:
-                base.__init__(self)
+        for other_init in inits:
+            other_init(self)
     return init
 
+@lru_cache(maxsize=None)
 def _modelled_new_immutable(base):
     """Make a function for use as __new__ of a specialised immutable type.
 
     A __new__ method must be used to supply the initialisation value for an
     immutable class instance: a value cannot be supplied using a __init__ method
-    (attempting this raises |TypeError|).
+    (attempting this raises |TypeError|). The function depends only on `base`,
+    so one function is shared by all specialised types of `base`.
     """
+    base_new = base.__new__
     def new(cls, val=()):
         """Create a specialised class instance from `val`."""
         try:
@@ -132,7 +151,7 @@ def _modelled_new_immutable(base):
         except NotDefinedError as err:
             raise NotDefinedError(cls) from err
         else:
-            return base.__new__(cls, val)
+            return base_new(cls, val)
     return new
 
 def _modelled_init_immutable(bases, body):
@@ -144,18 +163,18 @@ def _modelled_init_immutable(bases, body):
     __init__ method in `body`, then the __init__ method for each other base in
     `bases` is called. (No value is supplied to any of these calls.)
     """
+    base_init = bases[0].__init__
+    # class-specific initialisation, or other bases initialisation
+    inits = (body['__init__'],) if '__init__' in body else tuple(
+        base.__init__ for base in bases[1:]
+    )
     def init(self, val=None): # pylint: disable=unused-argument
         """Initialise `self`, a specialised class instance, ignoring `val`."""
         # init the type that is being specialised
-        bases[0].__init__(self)
+        base_init(self)
         # init other bases
-        if '__init__' in body:
-            # class-specific initialisation
-            body['__init__'](self)
-        else:
-            # other bases initialisation
-            for base in bases[1:]:
-                base.__init__(self)
+        for other_init in inits:
+            other_init(self)
     return init
 
 class Model(ValueType):
@@ -165,10 +184,18 @@ class Model(ValueType):
     instances of a specialised class. The enforcement rules are specified in
     `model_spec` and `policy_spec`.
     """
+    __slots__ = (
+        '_model_spec',
+        '_model_spec_view',
+        '_policy_spec',
+        '_policy_code',
+    )
     def __init__(self, model_spec, policy_spec):
         super().__init__()
         self._model_spec = None
+        self._model_spec_view = None
         self._policy_spec = None
+        self._policy_code = None
         self.model_spec = model_spec
         self.policy_spec = policy_spec
     def _define(self):
@@ -180,8 +207,11 @@ class Model(ValueType):
         return self._model_spec is not None
     @property
     def model_spec(self):
-        """Return the model spec if it is defined. Otherwise return None."""
-        return dict(self._model_spec) if self.defined else None
+        """Return the model spec if it is defined. Otherwise return None.
+
+        The model spec is returned as a read-only mapping.
+        """
+        return self._model_spec_view
     @model_spec.setter
     def model_spec(self, val):
         """Set the model spec from `val` then define the model.
@@ -196,7 +226,9 @@ class Model(ValueType):
             return
         if not isinstance(val, dict):
             raise ValueError(val)
-        self._model_spec = val
+        # copy `val` so that the spec reported matches the spec enforced
+        self._model_spec = dict(val)
+        self._model_spec_view = MappingProxyType(self._model_spec)
         self._define()
     @property
     def policy_spec(self):
@@ -208,7 +240,12 @@ class Model(ValueType):
 
         Raise |ValueError| if `policy` is not a supported :data:`POLICY`.
         """
-        self._policy_spec = POLICY(policy)
+        # _POLICY_CODES holds exactly the POLICY values
+        try:
+            self._policy_code = _POLICY_CODES[policy]
+        except (KeyError, TypeError):
+            raise ValueError(policy) from None
+        self._policy_spec = policy
 
 class MappingModel(Model):
     """A model codifying enforcement rules for specialised mappings.
@@ -219,6 +256,7 @@ class MappingModel(Model):
     setting :attr:`model_spec` before using this instance. `policy_spec` must be
     a supported :data:`POLICY` value.
     """
+    __slots__ = ()
     def _define(self):
         raise NotImplementedError
     def default_value(self, key): # pylint: disable=no-self-use
@@ -266,6 +304,43 @@ class MappingModel(Model):
     def pairs_free(self, mapping): # pylint: disable=no-self-use
         """Return a set of keys which may be freely removed from `mapping`."""
         return set(mapping)
+    def _free_keys_snapshot(self, mapping):
+        """Return a snapshot of the keys which may be freely removed.
+
+        The keys are collected from `mapping` up front, so pairs may be removed
+        from `mapping` while iterating the snapshot.
+        """
+        return self.pairs_free(mapping)
+
+def _build_pair_tables(model_spec):
+    """Build the pair lookup tables for a :class:`DictModel`.
+
+    Return a 4-tuple from the pair models in `model_spec`: a dict mapping keys
+    to value types; a frozenset of mandatory keys; a frozenset of constant
+    keys; and a dict mapping keys to default values. Raise |ValueError| if a
+    pair model has a value type which is not a |ValueType|.
+    """
+    value_types = {}
+    mandatory_pairs = set()
+    constant_pairs = set()
+    defaults = {}
+    for (key, spec) in model_spec.items():
+        value_type = spec.get('value_type', _ANY)
+        if not isinstance(value_type, ValueType):
+            raise ValueError(value_type)
+        value_types[key] = value_type
+        if spec.get('mandatory', False):
+            mandatory_pairs.add(key)
+        if spec.get('constant', False):
+            constant_pairs.add(key)
+        if 'default' in spec:
+            defaults[key] = spec['default']
+    return (
+        value_types,
+        frozenset(mandatory_pairs),
+        frozenset(constant_pairs),
+        defaults,
+    )
 
 class DictModel(MappingModel):
     """A model codifying enforcement rules for specialised dicts.
@@ -287,42 +362,35 @@ class DictModel(MappingModel):
     value is explicitly set. A default value should conform to this pair's
     'value_type' (though this is not enforced).
     """
+    __slots__ = (
+        '_keys',
+        '_value_types',
+        '_mandatory_pairs',
+        '_constant_pairs',
+        '_defaults',
+    )
     def __init__(self, model_spec, policy_spec):
-        self._pair_model = {}
+        self._keys = ()
+        self._value_types = {}
         self._mandatory_pairs = frozenset()
+        self._constant_pairs = frozenset()
+        self._defaults = {}
         super().__init__(model_spec, policy_spec)
     def _define(self):
-        mandatory_pairs = set()
-        for key in self._model_spec:
-            self._pair_model[key] = self._to_pair_model(self._model_spec[key])
-            if self.is_mandatory(key):
-                mandatory_pairs.add(key)
-        self._mandatory_pairs = frozenset(mandatory_pairs)
+        (
+            self._value_types,
+            self._mandatory_pairs,
+            self._constant_pairs,
+            self._defaults,
+        ) = _build_pair_tables(self._model_spec)
+        self._keys = tuple(self._model_spec)
     def __iter__(self):
         """Yield the pair keys in the model spec."""
-        if self.defined:
-            for key in self._model_spec:
-                yield key
+        yield from self._keys
     @property
     def mandatory(self):
         """A frozenset of the keys of mandatory pairs."""
         return self._mandatory_pairs
-    @staticmethod
-    def _to_pair_model(spec):
-        """Return a pair model from `spec`."""
-        model = {}
-        model['value_type'] = spec.get('value_type', Any())
-        if not isinstance(model['value_type'], ValueType):
-            raise ValueError(model['value_type'])
-        model['mandatory'] = bool(spec.get('mandatory', False))
-        model['constant'] = bool(spec.get('constant', False))
-        try:
-            model['default'] = spec['default']
-        except KeyError:
-            # omit 'default' to cause a |KeyError| to be raised
-            # when attempting to access it
-            pass
-        return model
     def screen_value(self, key, val):
         """Screen value for the pair at `key` from value `val`.
 
@@ -330,67 +398,73 @@ class DictModel(MappingModel):
         there is no model for `key`. Raise |TypeError| or |ValueError| if `val`
         does not conform to the model value type at `key`.
         """
-        return self._pair_model[key]['value_type'](val)
+        return self._value_types[key](val)
     def is_mandatory(self, key):
         """Return True if the pair at `key` is mandatory, False otherwise.
 
         Raise |KeyError| if there is no model for `key`.
         """
-        return self._pair_model[key]['mandatory']
+        if key not in self._value_types:
+            raise KeyError(key)
+        return key in self._mandatory_pairs
     def is_constant(self, key):
         """Return True if the pair at `key` is constant, False otherwise.
 
         Raise |KeyError| if there is no model for `key`.
         """
-        return self._pair_model[key]['constant']
+        if key not in self._value_types:
+            raise KeyError(key)
+        return key in self._constant_pairs
     def default_value(self, key):
         """Return the default value for the pair at `key`.
 
         Raise |KeyError| if there is no model for `key`.
         Raise |KeyError| if there is no default value for `key`.
         """
-        return self._pair_model[key]['default']
+        return self._defaults[key]
     def screen_setitem(self, mapping, key, val):
-        try:
-            val = self.screen_value(key, val)
-        except KeyError:
-            if self.policy_spec != 'must-accept':
-                raise
+        value_type = self._value_types.get(key)
+        if value_type is not None:
+            return (key, value_type(val))
+        if self._policy_code != _MUST_ACCEPT:
+            raise KeyError(key)
         return (key, val)
     def screen_moditem(self, mapping, key, val):
-        try:
-            constant = self.is_constant(key)
-        except KeyError:
-            pass
-        else:
-            if constant:
-                raise KeyError(key)
-        try:
-            val = self.screen_value(key, val)
-        except KeyError:
-            pass
+        if key in self._constant_pairs:
+            raise KeyError(key)
+        value_type = self._value_types.get(key)
+        if value_type is not None:
+            val = value_type(val)
         return (key, val)
     def screen_delitem(self, mapping, key):
-        try:
-            mandatory = self.is_mandatory(key)
-        except KeyError:
-            pass
-        else:
-            if mandatory:
-                raise KeyError(key)
+        if key in self._mandatory_pairs:
+            raise KeyError(key)
         return key
     def screen_update(self, mapping, other):
-        for key in other:
-            try:
-                if key in mapping:
-                    self.screen_moditem(mapping, key, other[key])
-                else:
-                    self.screen_setitem(mapping, key, other[key])
-            except (KeyError, TypeError, ValueError) as err:
-                raise ValueError(other) from err
-        return other
+        value_type_at = self._value_types.get
+        constant_pairs = self._constant_pairs
+        accept = self._policy_code == _MUST_ACCEPT
+        formed = {}
+        for (key, val) in other.items():
+            value_type = value_type_at(key)
+            if value_type is None:
+                # no model => set only if policy accepts, modify freely
+                if not (accept or key in mapping):
+                    raise ValueError(other)
+                formed[key] = val
+            elif key in constant_pairs and key in mapping:
+                raise ValueError(other)
+            else:
+                try:
+                    formed[key] = value_type(val)
+                except (TypeError, ValueError) as err:
+                    raise ValueError(other) from err
+        return formed
     def pairs_free(self, mapping):
         return set(mapping) - self.mandatory
+    def _free_keys_snapshot(self, mapping):
+        mandatory = self._mandatory_pairs
+        return [key for key in mapping if key not in mandatory]
     def check(self, val):
         try:
             dict(val)
@@ -406,50 +480,99 @@ class DictModel(MappingModel):
         |ValueError| if the input value does not conform to the type model.
         Raise |NotDefinedError| if the type model is not yet defined.
         """
-        val = dict(val)
         if not self.defined:
             raise NotDefinedError(self.__class__)
+        if not isinstance(val, dict):
+            val = dict(val)
+        if not val and not self._mandatory_pairs:
+            # nothing to form and nothing missing
+            return {}
+        value_type_at = self._value_types.get
+        policy = self._policy_code
         formed = {}
-        for key in val:
-            try:
-                formed[key] = self.screen_value(key, val[key])
-            except KeyError:
-                if self._policy_spec == 'must-understand':
-                    raise ValueError(f'value not allowed at {key}') from None
-                if self._policy_spec == 'must-accept':
-                    formed[key] = val[key]
-                # else self._policy_spec == 'must-ignore' => discard
-            except (TypeError, ValueError) as err:
-                reason = f'bad value for {key}: {str(err)}'
-                raise err.__class__(reason) from None
-        missing = self.mandatory - formed.keys()
-        if missing:
-            raise ValueError(f'missing values at {", ".join(missing)}')
+        for (key, item) in val.items():
+            value_type = value_type_at(key)
+            if value_type is not None:
+                try:
+                    formed[key] = value_type(item)
+                except (TypeError, ValueError) as err:
+                    reason = f'bad value for {key}: {err}'
+                    raise err.__class__(reason) from None
+            elif policy == _MUST_UNDERSTAND:
+                raise ValueError(f'value not allowed at {key}')
+            elif policy == _MUST_ACCEPT:
+                formed[key] = item
+            # else policy == _MUST_IGNORE => discard
+        mandatory = self._mandatory_pairs
+        if mandatory:
+            missing = mandatory.difference(formed)
+            if missing:
+                raise ValueError(f'missing values at {", ".join(missing)}')
         return formed
 
-def _modelled_dict_missing(self, key):
-    """Return the default value at `key` in specialised dict `self`."""
-    return self.model.default_value(key)
+### ModelledDict places dict first in a specialised class's bases, so the
+### base dict methods can be called directly rather than through super()
+_dict_setitem = dict.__setitem__
+_dict_delitem = dict.__delitem__
 
-def _modelled_dict_setitem(self, key, val):
-    """Set the value at `key` in specialised dict `self` using value `val`."""
-    if key in self:
-        (key, val) = self.model.screen_moditem(self, key, val)
-    else:
-        (key, val) = self.model.screen_setitem(self, key, val)
-    # perform set using base (dict) method
-    super(self.__class__, self).__setitem__(key, val)
-
-def _modelled_dict_delitem(self, key):
-    """Delete the value at `key` in specialised dict `self`."""
-    key = self.model.screen_delitem(self, key)
-    # perform delete using base (dict) method
-    super(self.__class__, self).__delitem__(key)
-
-def _modelled_dict_clear(self):
-    """Remove all free pairs from specialised dict `self`."""
-    for key in self.model.pairs_free(self):
-        del self[key]
+def _modelled_dict_missing(model):
+    """Make a function for use as __missing__ of a specialised dict type.
+
+    The function returns default values from `model`, the type model of the
+    specialised dict type.
+    """
+    default_value = model.default_value
+    def missing(self, key): # pylint: disable=unused-argument
+        """Return the default value at `key` in specialised dict `self`."""
+        return default_value(key)
+    return missing
+
+def _modelled_dict_setitem(model):
+    """Make a function for use as __setitem__ of a specialised dict type.
+
+    The function screens items using `model`, the type model of the
+    specialised dict type.
+    """
+    (screen_setitem, screen_moditem) = (
+        model.screen_setitem,
+        model.screen_moditem,
+    )
+    def setitem(self, key, val):
+        """Set the value at `key` in specialised dict `self` using `val`."""
+        if key in self:
+            (key, val) = screen_moditem(self, key, val)
+        else:
+            (key, val) = screen_setitem(self, key, val)
+        # perform set using base (dict) method
+        _dict_setitem(self, key, val)
+    return setitem
+
+def _modelled_dict_delitem(model):
+    """Make a function for use as __delitem__ of a specialised dict type.
+
+    The function screens deletions using `model`, the type model of the
+    specialised dict type.
+    """
+    screen_delitem = model.screen_delitem
+    def delitem(self, key):
+        """Delete the value at `key` in specialised dict `self`."""
+        key = screen_delitem(self, key)
+        # perform delete using base (dict) method
+        _dict_delitem(self, key)
+    return delitem
+
+def _modelled_dict_clear(model):
+    """Make a function for use as clear of a specialised dict type.
+
+    The function removes the free pairs determined by `model`, the type model
+    of the specialised dict type.
+    """
+    free_keys = model._free_keys_snapshot # pylint: disable=protected-access
+    def clear(self):
+        """Remove all free pairs from specialised dict `self`."""
+        for key in free_keys(self):
+            del self[key]
+    return clear
 
 def _modelled_dict_pop(self, key, default=None):
     """Remove `key` from specialised dict `self`, or return `default`."""
@@ -479,16 +602,26 @@ def _modelled_dict_setdefault(self, key, default=None):
     self[key] = default
     return default
 
-def _modelled_dict_update(self, other=None):
-    """Update specialised dict `self` with (key, val) pairs from `other`."""
-    if not other:
-        return
-    # screen other
-    other = self.model.screen_update(self, dict(other))
-    # update self
-    for key in other:
-        # perform set using base (dict) method
-        super(self.__class__, self).__setitem__(key, other[key])
+def _modelled_dict_update(model):
+    """Make a function for use as update of a specialised dict type.
+
+    The function screens updates using `model`, the type model of the
+    specialised dict type.
+    """
+    screen_update = model.screen_update
+    def update(self, other=None):
+        """Update specialised dict `self` with (key, val) pairs from `other`."""
+        if not other:
+            return
+        # screen other, only copying it when it is not already a dict
+        if not isinstance(other, dict):
+            other = dict(other)
+        other = screen_update(self, other)
+        # update self
+        for (key, val) in other.items():
+            # perform set using base (dict) method
+            _dict_setitem(self, key, val)
+    return update
 
 class ModelledDict(type):
     """A metaclass for constructing specialised dict classes.
@@ -607,45 +740,45 @@ class ModelledDict(type):
     """
     def __new__(cls, name, bases, dct):
         name = str(name)
-        obases = list(bases)
         dct = dict(dct)
         # order bases: ensure dict first
-        try:
-            obases.remove(dict)
-        except ValueError:
-            pass
-        obases.insert(0, dict)
-        bases = tuple(obases)
+        bases = (dict,) + tuple(base for base in bases if base is not dict)
         # get the type model class
         model_cls = dct.get('model_cls', DictModel)
         # get the class 'model' specification
         try:
-            model_spec = dict(dct['model'])
+            model_spec = dct['model']
         except KeyError:
             # No model defined, usually for the purposes of creating a forward
             # declaration/self-reference. The model must be defined before
             # using an instance of this class.
             model_spec = None
+        else:
+            # the model copies a dict spec when it is set: only convert other
+            # values
+            if model_spec.__class__ is not dict:
+                model_spec = dict(model_spec)
         # get the class 'policy' specification
         policy_spec = dct.get('policy', 'must-understand')
         # build the class body...
-        # ...from specified methods and attributes in `dct`
-        body = dict(dct)
+        # ...from specified methods and attributes in `dct` (already a copy)
+        body = dct
         # ...overriding with ModelledDict methods and attributes
+        model = model_cls(model_spec, policy_spec)
         body.update({
             # class-related
-            'model': model_cls(model_spec, policy_spec),
+            'model': model,
             'define': classmethod(_modelled_define),
-            # instance-related
+            # instance-related, specialised for `model`
             '__init__': _modelled_init_mutable(bases, dct),
-            '__missing__': _modelled_dict_missing,
-            '__setitem__': _modelled_dict_setitem,
-            '__delitem__': _modelled_dict_delitem,
-            'clear': _modelled_dict_clear,
+            '__missing__': _modelled_dict_missing(model),
+            '__setitem__': _modelled_dict_setitem(model),
+            '__delitem__': _modelled_dict_delitem(model),
+            'clear': _modelled_dict_clear(model),
             'pop': _modelled_dict_pop,
             'popitem': _modelled_dict_popitem,
             'setdefault': _modelled_dict_setdefault,
-            'update': _modelled_dict_update,
+            'update': _modelled_dict_update(model),
         })
         return super().__new__(cls, name, bases, body)
     @classmethod
@@ -658,6 +791,52 @@ class ModelledDict(type):
         """
         return cls(name, bases, {})
 
+def _all_unique(items):
+    """Return True if no two values in list `items` are equal, else False."""
+    try:
+        # a set built in C beats any scan written in Python, even for a few
+        # items, but needs hashable items
+        return len(items) == len(set(items))
+    except TypeError:
+        pass
+    for (idx, item) in enumerate(items):
+        if item in items[idx + 1:]:
+            return False
+    return True
+
+def _build_tail_former(tail, policy_code):
+    """Build a tail former function for a :class:`SequenceModel`.
+
+    Return a function which appends to list `formed` the values formed from
+    iterable `items`, the elements following those already in `formed`, and
+    returns `formed`. Elements are formed by |ValueType| `tail`, if set,
+    otherwise according to the policy with code `policy_code`.
+    """
+    if tail:
+        def form(formed, items):
+            append = formed.append
+            for (idx, item) in enumerate(items, len(formed)):
+                try:
+                    append(tail(item))
+                except (TypeError, ValueError) as err:
+                    reason = f'bad value at #{idx}: {err}'
+                    raise err.__class__(reason) from None
+            return formed
+    elif policy_code == _MUST_UNDERSTAND:
+        def form(formed, items):
+            for _ in items:
+                raise ValueError(f'value not allowed at #{len(formed)}')
+            return formed
+    elif policy_code == _MUST_ACCEPT:
+        def form(formed, items):
+            formed.extend(items)
+            return formed
+    else:
+        ### policy_code == _MUST_IGNORE (or not yet set) => discard
+        def form(formed, items): # pylint: disable=unused-argument
+            return formed
+    return form
+
 class SequenceModel(Model):
     """A model codifying enforcement rules for specialised sequences.
 
@@ -702,7 +881,19 @@ class SequenceModel(Model):
     model must be supplied by setting :attr:`model_spec` before using this
     instance. `policy_spec` must be a supported :data:`POLICY` value.
     """
+    __slots__ = (
+        '_head',
+        '_tail',
+        '_min',
+        '_max',
+        '_unique',
+        '_condition',
+        '_form_tail',
+        '_head_uniform',
+    )
     def __init__(self, model_spec, policy_spec):
+        self._form_tail = None
+        self._head_uniform = None
         self._head = ()
         self._tail = None
         self._min = 0
@@ -711,10 +902,14 @@ class SequenceModel(Model):
         self._condition = None
         super().__init__(model_spec, policy_spec)
     def _define(self):
-        self._head = self._model_spec.get('head', ())
+        self._head = tuple(self._model_spec.get('head', ()))
         for value_type in self._head:
             if not isinstance(value_type, ValueType):
                 raise ValueError(f'bad value type in head {self._head}')
+        # a head of one value type can be formed without per-element dispatch
+        self._head_uniform = None
+        if self._head and all(_ is self._head[0] for _ in self._head):
+            self._head_uniform = self._head[0]
         self._tail = self._model_spec.get('tail')
         if self._tail and not isinstance(self._tail, ValueType):
             raise ValueError(f'bad value type in tail {self._tail}')
@@ -728,13 +923,25 @@ class SequenceModel(Model):
             self._max = None
         self._unique = bool(self._model_spec.get('unique', False))
         self._condition = self._model_spec.get('condition')
+        self._build_form_tail()
+    def _build_form_tail(self):
+        """Build the tail former for the current tail and policy."""
+        self._form_tail = _build_tail_former(self._tail, self._policy_code)
+    @Model.policy_spec.setter
+    def policy_spec(self, policy):
+        """Set the policy spec from `policy`.
+
+        Raise |ValueError| if `policy` is not a supported :data:`POLICY`.
+        """
+        Model.policy_spec.fset(self, policy)
+        self._build_form_tail()
     def check(self, val):
-        try:
-            iter(val)
-        except (TypeError, ValueError):
-            return False
-        else:
-            return True
+        # probe the type as iter() does: __iter__, unless explicitly None,
+        # otherwise the sequence protocol
+        cls = type(val)
+        if hasattr(cls, '__iter__'):
+            return cls.__iter__ is not None
+        return hasattr(cls, '__getitem__')
     def __call__(self, val):
         """Enforce this specialised sequence model on `val`.
 
@@ -743,41 +950,47 @@ class SequenceModel(Model):
         |ValueError| if the input value does not conform to the type model.
         Raise |NotDefinedError| if the type model is not yet defined.
         """
-        val = tuple(val)
+        # only indexing and length are needed: copy anything but a tuple or list
+        if val.__class__ is not tuple and val.__class__ is not list:
+            val = tuple(val)
         if not self.defined:
             raise NotDefinedError(self.__class__)
-        formed = []
-        idx = 0
+        max_ = self._max
+        # unless elements may be discarded, every element is formed (or the
+        # value rejected): reject an overlong value before forming any
+        if (max_ is not None and max_ < len(val) and (
+                self._tail or self._policy_code != _MUST_IGNORE
+            )):
+            raise ValueError(val)
         # form head elements
-        while idx < len(val):
+        formed = None
+        if self._head_uniform is not None:
             try:
-                formed.append(self._head[idx](val[idx]))
-            except IndexError:
-                break
-            except (TypeError, ValueError) as err:
-                reason = f'bad value at #{idx}: {str(err)}'
-                raise err.__class__(reason) from None
-            idx += 1
-        # form tail elements
-        while idx < len(val):
-            if self._tail:
+                formed = list(map(self._head_uniform, val[:len(self._head)]))
+            except (TypeError, ValueError):
+                # form element by element below, to report the bad element
+                pass
+        if formed is None:
+            formed = []
+            append = formed.append
+            for (idx, (head, item)) in enumerate(zip(self._head, val)):
                 try:
-                    formed.append(self._tail(val[idx]))
+                    append(head(item))
                 except (TypeError, ValueError) as err:
-                    reason = f'bad value at #{idx}: {str(err)}'
+                    reason = f'bad value at #{idx}: {err}'
                     raise err.__class__(reason) from None
-            elif self._policy_spec == 'must-understand':
-                raise ValueError(f'value not allowed at #{idx}')
-            elif self._policy_spec == 'must-accept':
-                formed.append(val[idx])
-            # else self._policy_spec == 'must-ignore' => discard
-            idx += 1
-        error = False
-        error = error or (len(formed) < self._min)
-        error = error or ((self._max is not None) and self._max < len(formed))
-        error = error or (self._unique and len(formed) != len(frozenset(formed)))
-        error = error or (self._condition and not bool(self._condition(formed)))
-        if error:
+        # form tail elements
+        self._form_tail(formed, islice(val, len(formed), None))
+        # check constraints, cheapest first
+        length = len(formed)
+        if length < self._min:
+            raise ValueError(val)
+        if max_ is not None and max_ < length:
+            raise ValueError(val)
+        if self._unique and length > 1 and not _all_unique(formed):
+            raise ValueError(val)
+        condition = self._condition
+        if condition is not None and not condition(formed):
             raise ValueError(val)
         return formed
 
@@ -822,30 +1035,29 @@ class ModelledTuple(type): # pylint: disable=too-few-public-methods
     """
     def __new__(cls, name, bases, dct):
         name = str(name)
-        obases = list(bases)
         dct = dict(dct)
         # order bases: ensure tuple first
-        try:
-            obases.remove(tuple)
-        except ValueError:
-            pass
-        obases.insert(0, tuple)
-        bases = tuple(obases)
+        bases = (tuple,) + tuple(base for base in bases if base is not tuple)
         # get the type model class
         model_cls = dct.get('model_cls', SequenceModel)
         # get the class 'model' specification
         try:
-            model_spec = dict(dct['model'])
+            model_spec = dct['model']
         except KeyError:
             # No model defined, usually for the purposes of creating a forward
             # declaration/self-reference. The model must be defined before
             # using an instance of this class.
             model_spec = None
+        else:
+            # the model copies a dict spec when it is set: only convert other
+            # values
+            if model_spec.__class__ is not dict:
+                model_spec = dict(model_spec)
         # get the class 'policy' specification
         policy_spec = dct.get('policy', 'must-understand')
         # build the class body...
-        # ...from specified methods and attributes in `dct`
-        body = dict(dct)
+        # ...from specified methods and attributes in `dct` (already a copy)
+        body = dct
         # ...overriding with ModelledTuple methods and attributes
         body.update({
             # class-related
@@ -30,4 +30,20 @@ def make_params_pairs(arg_values):
 
 def make_values_not_in(values, other):
     """Return a tuple of `values` not in `other`."""
-    return tuple(v for v in values if v not in other)
+    # test hashable values against a set, others against a (short) list
+    hashable = set()
+    unhashable = []
+    for val in other:
+        try:
+            hashable.add(val)
+        except TypeError:
+            unhashable.append(val)
+    def is_in(val):
+        """Return True if `val` is in `other`, otherwise False."""
+        try:
+            if val in hashable:
+                return True
+        except TypeError:
+            pass
+        return val in unhashable
+    return tuple(v for v in values if not is_in(v))
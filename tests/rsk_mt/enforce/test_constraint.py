@@ -120,10 +120,17 @@ class _ConstraintTestBuilder(type):
     @staticmethod
     def make_test_call(constructor, fqname, pairs, expect):
         """Make a function testing for expected call results."""
+        # construct once per arg: args may be unhashable but live as long as
+        # the test class, so key on identity
+        constraints = {}
         @params(*pairs)
         def method(self, arg, value):
             """Test call gives result `expect`"""
-            self.assertEqual(constructor(arg)(value), expect)
+            try:
+                constraint = constraints[id(arg)]
+            except KeyError:
+                constraint = constraints[id(arg)] = constructor(arg)
+            self.assertEqual(constraint(value), expect)
         method.__doc__ = f'Test {fqname} call gives result {expect}'
         return method
 
@@ -124,14 +124,16 @@ class _UnitsTestBuilder(type):
     @staticmethod
     def make_test_convert(constructor, fqname, required):
         """Make a function testing `required` conversions."""
+        # conversions do not modify instances: share them between conversions
+        instance = constructor()
+        rounder = constructor(ndigits=3)
         @params(*required)
         def method(self, f_val, f_units, t_val, t_units):
             """Test `constructor` with required conversions."""
             self.assertEqual(
-                constructor().convert(f_val, from_=f_units, to_=t_units),
+                instance.convert(f_val, from_=f_units, to_=t_units),
                 t_val,
             )
-            rounder = constructor(ndigits=3)
             self.assertEqual(
                 rounder.convert(f_val, from_=f_units, to_=t_units),
                 round(t_val, 3),
@@ -2,12 +2,29 @@
 
 """Test JSON Schema encoding: base64"""
 
+from base64 import b64encode
+from random import Random
+
 from unittest import TestCase
 
 from rsk_mt.jsonschema.encodings import Base64
 
 from .test_encoding import EncodingTestBuilder
 
+def make_encoded(seed, lengths):
+    """Return a tuple of base64 encodings of pseudo-random data.
+
+    One encoding is made for each data length in `lengths`. The data is drawn
+    from a generator seeded with `seed`, so every run tests the same values.
+    """
+    rnd = Random(seed)
+    return tuple(
+        b64encode(rnd.randbytes(num)).decode() for num in lengths
+    )
+
+# data lengths 1 to 9 cover each amount of padding
+ENCODED = make_encoded(2045, range(1, 10))
+
 class TestBase64(TestCase, metaclass=EncodingTestBuilder):
     """Test JSON Schema encoding base64."""
     constructor = Base64
@@ -17,9 +34,12 @@ class TestBase64(TestCase, metaclass=EncodingTestBuilder):
         "YQ==",         # "a"
         "Zm9vYmFyYmF6", # "foobarbaz"
         "Zm9=",         # "fo"
-    )
+    ) + ENCODED
     reject = (
         "Z",
         "Zm",
         "Zm9",
+    ) + tuple(
+        # truncated to a length which is not a multiple of 4
+        val[:num] for val in ENCODED for num in range(1, len(val)) if num % 4
     )
@@ -73,30 +73,31 @@ class EncodingTestBuilder(type):
     @staticmethod
     def make_test_accept(constructor, fqname, values):
         """Make a function testing encoding accepts `values`."""
+        # encodings are stateless: share one between values
+        encoding = constructor()
         @params(*values)
         def method(self, value):
             """Test encoding accepts `value`."""
-            encoding = constructor()
             self.assertEqual(encoding(value), True)
         method.__doc__ = f'Test {fqname} accepts value'
         return method
     @staticmethod
     def make_test_reject(constructor, fqname, values):
         """Make a function testing encoding rejects `values`."""
+        encoding = constructor()
         @params(*values)
         def method(self, value):
             """Test encoding rejects `value`."""
-            encoding = constructor()
             self.assertEqual(encoding(value), False)
         method.__doc__ = f'Test {fqname} rejects value'
         return method
     @staticmethod
     def make_test_invalid(constructor, fqname, values):
         """Make a function testing encoding rejects invalid `values`."""
+        encoding = constructor()
         @params(*values)
         def method(self, value):
             """Test encoding rejects invalid `value`."""
-            encoding = constructor()
             self.assertEqual(encoding(value), False)
         method.__doc__ = f'Test {fqname} rejects invalid `value`'
         return method
@@ -41,14 +41,6 @@ class TestDateTime(TestCase, metaclass=FormatTestBuilder):
         '2017-01-01T00:00:00-24:00',
         '2017-01-01T00:00:00+00:60',
     )
-    invalid = (
-        None,
-        False, True,
-        -1, 0, 1,
-        -1.5, 0.0, 1.5,
-        [], ["foo", "bar", "baz"],
-        {}, {"foo": "bar"},
-    )
 
 class TestDate(TestCase, metaclass=FormatTestBuilder):
     """Test JSON Schema format date."""
@@ -68,14 +60,6 @@ class TestDate(TestCase, metaclass=FormatTestBuilder):
         '2017-13-01',
         '2017-01-32',
     )
-    invalid = (
-        None,
-        False, True,
-        -1, 0, 1,
-        -1.5, 0.0, 1.5,
-        [], ["foo", "bar", "baz"],
-        {}, {"foo": "bar"},
-    )
 
 class TestTime(TestCase, metaclass=FormatTestBuilder):
     """Test JSON Schema format time."""
@@ -101,11 +85,3 @@ class TestTime(TestCase, metaclass=FormatTestBuilder):
         '00:00:00-24:00',
         '00:00:00+00:60',
     )
-    invalid = (
-        None,
-        False, True,
-        -1, 0, 1,
-        -1.5, 0.0, 1.5,
-        [], ["foo", "bar", "baz"],
-        {}, {"foo": "bar"},
-    )
@@ -38,11 +38,25 @@ class FormatTestBuilder(type):
     `validate` - an iterable of strings, the primitives this Format validates
     `accept` - an iterable of string values this Format must accept
     `reject` - an iterable of string values this Format must reject
-    `invalid` - an iterable of other values this Format must reject
+
+    Optionally provide:
+    `invalid` - an iterable of other values this Format must reject, in place
+    of the default non-string values in :attr:`invalid`
     """
+    invalid = (
+        None,
+        False, True,
+        -1, 0, 1,
+        -1.5, 0.0, 1.5,
+        [], ["foo", "bar", "baz"],
+        {}, {"foo": "bar"},
+    )
     def __new__(cls, name, bases, dct):
         constructor = dct['constructor']
         fqname = make_fqname(constructor)
+        # formats are not modified by testing: share one instance between all
+        # value tests built for `constructor`
+        format_ = constructor()
         # build out class for testing `constructor`
         dct.update({
             'test_name': cls.make_test_name(
@@ -50,24 +64,24 @@ class FormatTestBuilder(type):
                 dct['name'],
             ),
             'test_validate': cls.make_test_validate(
-                constructor, fqname,
+                format_, fqname,
                 make_params_values(dct['validate']),
             ),
             'test_not_validate': cls.make_test_not_validate(
-                constructor, fqname,
+                format_, fqname,
                 make_params_values(PRIMITIVES - frozenset(dct['validate'])),
             ),
             'test_accept': cls.make_test_accept(
-                constructor, fqname,
+                format_, fqname,
                 make_params_values(dct['accept']),
             ),
             'test_reject': cls.make_test_reject(
-                constructor, fqname,
+                format_, fqname,
                 make_params_values(dct['reject']),
             ),
             'test_invalid': cls.make_test_invalid(
-                constructor, fqname,
-                make_params_values(dct['invalid']),
+                format_, fqname,
+                make_params_values(dct.get('invalid', cls.invalid)),
             ),
         })
         return super().__new__(cls, name, bases, dct)
@@ -82,52 +96,47 @@ class FormatTestBuilder(type):
         method.__doc__ = f'Test {fqname} name attribute'
         return method
     @staticmethod
-    def make_test_validate(constructor, fqname, primitives):
+    def make_test_validate(format_, fqname, primitives):
         """Make a function testing format validates `primitives`."""
         @params(*primitives)
         def method(self, primitive):
             """Test format validates `primitive`."""
-            format_ = constructor()
-            self.assertEqual(format_.validates(primitive), True)
+            self.assertIs(format_.validates(primitive), True)
         method.__doc__ = f'Test {fqname} validates primitive'
         return method
     @staticmethod
-    def make_test_not_validate(constructor, fqname, primitives):
+    def make_test_not_validate(format_, fqname, primitives):
         """Make a function testing format does not validate `primitives`."""
         @params(*primitives)
         def method(self, primitive):
             """Test format does not validate `primitive`."""
-            format_ = constructor()
-            self.assertEqual(format_.validates(primitive), False)
+            self.assertIs(format_.validates(primitive), False)
         method.__doc__ = f'Test {fqname} does not validate primitive'
         return method
     @staticmethod
-    def make_test_accept(constructor, fqname, values):
+    def make_test_accept(format_, fqname, values):
         """Make a function testing format accepts `values`."""
         @params(*values)
         def method(self, value):
             """Test format accepts `value`."""
-            format_ = constructor()
-            self.assertEqual(format_(value), True)
+            self.assertIs(format_(value), True)
         method.__doc__ = f'Test {fqname} accepts value'
         return method
     @staticmethod
-    def make_test_reject(constructor, fqname, values):
+    def make_test_reject(format_, fqname, values):
         """Make a function testing format rejects `values`."""
         @params(*values)
         def method(self, value):
             """Test format rejects `value`."""
-            format_ = constructor()
-            self.assertEqual(format_(value), False)
+            self.assertIs(format_(value), False)
         method.__doc__ = f'Test {fqname} rejects value'
         return method
     @staticmethod
-    def make_test_invalid(constructor, fqname, values):
+    def make_test_invalid(format_, fqname, values):
         """Make a function testing format rejects invalid `values`."""
         @params(*values)
         def method(self, value):
             """Test format rejects invalid `value`."""
-            format_ = constructor()
-            self.assertEqual(format_(value), False)
+            self.assertIs(format_(value), False)
         method.__doc__ = f'Test {fqname} rejects invalid `value`'
         return method
@@ -47,12 +47,12 @@ class TestHostname(TestCase, metaclass=FormatTestBuilder):
         ("A" * 63 + ".") * 3 + ("A" * 62 + "."),
         ("0" * 63 + ".") * 3 + ("0" * 62 + "."),
         ("a" + "-" * 62 + "a"),
-    )
-    invalid = (
-        None,
-        False, True,
-        -1, 0, 1,
-        -1.5, 0.0, 1.5,
-        [], ["foo", "bar", "baz"],
-        {}, {"foo": "bar"},
+        "-a.b",
+        "a-.b",
+        "a..b",
+        "a.b..",
+        "a_b",
+        "a b",
+        "a.b\n",
+        "실례.테스트",
     )
@@ -35,11 +35,3 @@ class TestLocationIndependentId(TestCase, metaclass=FormatTestBuilder):
         "#A^",
         "#A$",
     )
-    invalid = (
-        None,
-        False, True,
-        -1, 0, 1,
-        -1.5, 0.0, 1.5,
-        [], ["foo", "bar", "baz"],
-        {}, {"foo": "bar"},
-    )
@@ -92,11 +92,3 @@ class TestIPv4(TestCase, metaclass=FormatTestBuilder):
         "255.255.255.256",
         "255.255.255.256",
     )
-    invalid = (
-        None,
-        False, True,
-        -1, 0, 1,
-        -1.5, 0.0, 1.5,
-        [], ["foo", "bar", "baz"],
-        {}, {"foo": "bar"},
-    )
@@ -33,11 +33,3 @@ class TestIPv6(TestCase, metaclass=FormatTestBuilder):
     reject = (
         "", "string",
     )
-    invalid = (
-        None,
-        False, True,
-        -1, 0, 1,
-        -1.5, 0.0, 1.5,
-        [], ["foo", "bar", "baz"],
-        {}, {"foo": "bar"},
-    )
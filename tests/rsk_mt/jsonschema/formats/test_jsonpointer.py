@@ -44,14 +44,6 @@ class TestJsonPointer(TestCase, metaclass=FormatTestBuilder):
         "/foo/fo~o",
         "/foo/~2",
     )
-    invalid = (
-        None,
-        False, True,
-        -1, 0, 1,
-        -1.5, 0.0, 1.5,
-        [], ["foo", "bar", "baz"],
-        {}, {"foo": "bar"},
-    )
 
 class TestRelativeJsonPointer(TestCase, metaclass=FormatTestBuilder):
     """Test JSON Schema format relative-json-pointer."""
@@ -91,11 +83,3 @@ class TestRelativeJsonPointer(TestCase, metaclass=FormatTestBuilder):
         "1abc#",
         "123abc#",
     )
-    invalid = (
-        None,
-        False, True,
-        -1, 0, 1,
-        -1.5, 0.0, 1.5,
-        [], ["foo", "bar", "baz"],
-        {}, {"foo": "bar"},
-    )
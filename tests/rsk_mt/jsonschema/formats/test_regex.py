@@ -23,11 +23,3 @@ class TestRegex(TestCase, metaclass=FormatTestBuilder):
         "fo(o",
         "foo)",
     )
-    invalid = (
-        None,
-        False, True,
-        -1, 0, 1,
-        -1.5, 0.0, 1.5,
-        [], ["foo", "bar", "baz"],
-        {}, {"foo": "bar"},
-    )
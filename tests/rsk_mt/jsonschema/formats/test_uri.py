@@ -32,11 +32,3 @@ class TestUri(TestCase, metaclass=FormatTestBuilder):
         "urn:?foo=bar",
         "file:////etc/hostname",
     )
-    invalid = (
-        None,
-        False, True,
-        -1, 0, 1,
-        -1.5, 0.0, 1.5,
-        [], ["foo", "bar", "baz"],
-        {}, {"foo": "bar"},
-    )
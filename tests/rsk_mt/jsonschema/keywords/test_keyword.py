@@ -13,8 +13,6 @@ from rsk_mt.jsonschema.schema import (
     SchemaError,
 )
 
-from ... import make_params_values
-
 DEFAULT_URI = urlunsplit(('file', '', abspath(__file__), '', ''))
 
 class KeywordTestBuilder(type):
@@ -31,32 +29,38 @@ class KeywordTestBuilder(type):
         dct.update({
             'test_accept': cls.make_test_accept(
                 keyword,
-                make_params_values(dct['accept']),
+                cls.make_schemas(keyword, dct['accept']),
             ),
             'test_reject': cls.make_test_reject(
                 keyword,
-                make_params_values(dct['reject']),
+                cls.make_schemas(keyword, dct['reject']),
             ),
         })
         return super().__new__(cls, name, bases, dct)
+    # make helpers
+    @staticmethod
+    def make_schemas(keyword, values):
+        """Return an iterable of JSON-encoded schemas, one per `keyword` value.
+
+        Each schema is a JSON object with `keyword` as its only member.
+        """
+        return (json.dumps({keyword: value}) for value in values)
     # make functions for use as TestCase methods
     @staticmethod
-    def make_test_accept(keyword, values):
-        """Make a function testing `keyword` accepts `values`."""
-        @params(*values)
-        def method(self, value):
-            """Test keyword accepts `value`."""
-            schema = json.dumps({keyword: value})
+    def make_test_accept(keyword, schemas):
+        """Make a function testing `keyword` accepts `schemas`."""
+        @params(*schemas)
+        def method(self, schema):
+            """Test keyword accepts `schema`."""
             self.assertIsNotNone(RootSchema.loads(schema, DEFAULT_URI))
         method.__doc__ = f'Test JSON Schema keyword {keyword} accepts value'
         return method
     @staticmethod
-    def make_test_reject(keyword, values):
-        """Make a function testing `keyword` rejects `values`."""
-        @params(*values)
-        def method(self, value):
-            """Test keyword rejects `value`."""
-            schema = json.dumps({keyword: value})
+    def make_test_reject(keyword, schemas):
+        """Make a function testing `keyword` rejects `schemas`."""
+        @params(*schemas)
+        def method(self, schema):
+            """Test keyword rejects `schema`."""
             self.assertRaises(SchemaError, RootSchema.loads, schema, DEFAULT_URI)
         method.__doc__ = f'Test JSON Schema keyword {keyword} rejects value'
         return method
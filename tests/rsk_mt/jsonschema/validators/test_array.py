@@ -92,6 +92,20 @@ class TestItems(TestCase, metaclass=ValidatorTestBuilder):
             },
         ),
     )
+    def test_generator(self):
+        """Test JSON Schema validator array items accepts generator."""
+        self.assertEqual(
+            ("foo", "bar"),
+            # pylint: disable=no-member
+            self.validator(
+                (s for s in ("foo", "bar"))
+            ),
+        )
+        with self.assertRaises(TypeError):
+            # pylint: disable=no-member
+            self.validator(
+                (v for v in ("foo", 2))
+            )
 
 class TestAdditionalItemsForbidden(TestCase, metaclass=ValidatorTestBuilder):
     """Test JSON Schema validator array additionalItems forbidden."""
@@ -53,3 +53,8 @@ class TestNot(TestCase, metaclass=ValidatorTestBuilder):
             }
         ),
     )
+    def test_signed_zero(self):
+        """Test JSON Schema validator not returns its own float value."""
+        # pylint: disable=no-member
+        self.assertEqual(str(self.validator(0.0)), '0.0')
+        self.assertEqual(str(self.validator(-0.0)), '-0.0')
@@ -3,6 +3,9 @@
 """Test JSON Schema validator: object"""
 
 from unittest import TestCase
+import gc
+import re
+import weakref
 
 from rsk_mt.enforce.value import (
     String,
@@ -10,7 +13,9 @@ from rsk_mt.enforce.value import (
     Enum,
     ValueType,
 )
+from rsk_mt.jsonschema.schema import RootSchema
 from rsk_mt.jsonschema.validators import Object
+from rsk_mt.jsonschema.validators.object import build_pattern_union
 
 from .test_validator import (
     ValidatorTestBuilder,
@@ -60,6 +65,29 @@ class TestObject(TestCase, metaclass=ValidatorTestBuilder):
                 (pair for pair in (("foo", 1), ("bar", 2)))
             ),
         )
+    def test_reuse(self):
+        """Test JSON Schema validator object class is reused."""
+        self.assertIs(
+            # pylint: disable=no-member
+            self.validator,
+            Object(self.spec).validator(self.root, self.root.get_schema('#')),
+        )
+        self.assertIsNot(
+            # pylint: disable=no-member
+            self.validator,
+            Object(self.spec).validator(
+                MockRoot(self.base_uri),
+                self.root.get_schema('#'),
+            ),
+        )
+    def test_reuse_released(self):
+        """Test JSON Schema validator object class dies with its root."""
+        root = RootSchema({'type': 'object'}, self.base_uri)
+        root({'foo': 'A'})
+        ref = weakref.ref(root)
+        del root
+        gc.collect()
+        self.assertIsNone(ref())
 
 class TestMaxProperties(TestCase, metaclass=ValidatorTestBuilder):
     """Test JSON Schema validator object maxProperties."""
@@ -599,3 +627,24 @@ class TestPropertyNamesOver2(TestCase, metaclass=ValidatorTestBuilder):
         {"foo": "A", "bar": "B", "baz": "C"},
         {"foo": "A", "bar": 77, "baz": [1, 2, 3]},
     )
+
+class TestBuildPatternUnion(TestCase):
+    """Test rsk_mt.jsonschema.validators.object.build_pattern_union"""
+    def test_union(self):
+        """Test union matches if any regexp matches"""
+        union = build_pattern_union((re.compile('^a'), re.compile('b$')))
+        for key in ('a', 'xb', 'ab'):
+            self.assertIsNotNone(union.search(key))
+        for key in ('', 'ba', 'xax'):
+            self.assertIsNone(union.search(key))
+    def test_no_union(self):
+        """Test no union for unsafe or too few regexps"""
+        for patterns in (
+                (),
+                ('^a',),
+                ('^a', '(b)\\1'),
+                ('^a', '(?i)b'),
+            ):
+            self.assertIsNone(build_pattern_union(
+                tuple(re.compile(p) for p in patterns)
+            ))
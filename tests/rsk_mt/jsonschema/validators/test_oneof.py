@@ -6,6 +6,7 @@ from unittest import TestCase
 
 from rsk_mt.enforce.value import (Number, Constrained)
 from rsk_mt.enforce.constraint import Range
+from rsk_mt.jsonschema.schema import RootSchema
 from rsk_mt.jsonschema.validators import OneOf
 
 from .test_validator import (
@@ -66,3 +67,31 @@ class TestOneOf(TestCase, metaclass=ValidatorTestBuilder):
             },
         ),
     )
+
+class TestOneOfCandidates(TestCase):
+    """Test JSON Schema validator oneOf candidate schemas."""
+    def test_candidates(self):
+        """Test oneOf only tries schemas which may accept a value's type."""
+        root = RootSchema({
+            'oneOf': [
+                {'type': 'string'},
+                {'type': ['integer', 'null']},
+                {'type': 'number', 'minimum': 3},
+                {'const': 'bar'},
+            ],
+        }, 'test://oneOf/candidates/')
+        validator = OneOf(root.spec).validator(root, root)
+        for (val, refs) in (
+                ('foo', ('#/oneOf/0', '#/oneOf/3')),
+                (1, ('#/oneOf/1', '#/oneOf/2', '#/oneOf/3')),
+                (None, ('#/oneOf/1', '#/oneOf/3')),
+                (1.5, ('#/oneOf/2', '#/oneOf/3')),
+            ):
+            self.assertEqual(
+                validator.candidates(val),
+                tuple(root.get_schema(ref) for ref in refs),
+            )
+        self.assertEqual(validator('foo'), 'foo')
+        self.assertEqual(validator(3.5), 3.5)
+        self.assertRaises(ValueError, validator, 3)
+        self.assertRaises(ValueError, validator, 'bar')
@@ -6,7 +6,7 @@ from unittest import TestCase
 from nose2.tools import params
 
 from rsk_mt.jsonschema.schema import Results
-from rsk_mt.jsonschema.validators.validator import equal
+from rsk_mt.jsonschema.validators.validator import (equal, memoise)
 
 from ... import (
     make_fqname,
@@ -18,6 +18,11 @@ class MockRoot():
     def __init__(self, base_uri, subschemas=(), formats=()):
         self._schemas = {s.ref: s for s in (MockSchema(base_uri),) + subschemas}
         self._formats = dict(formats)
+        self._object_validator_classes = {}
+    @property
+    def object_validator_classes(self):
+        """Return the dict of Object validation classes, by schema URI."""
+        return self._object_validator_classes
     @staticmethod
     def get_bases(ref): # pylint: disable=unused-argument
         """Return an empty tuple => no custom bases."""
@@ -160,5 +165,70 @@ class TestEqual(TestCase):
                 (False, 0),
                 (True, 1),
                 ((1, 2, 3), [1, 2, 3]),
+                ([1, 2, 3], [1, 2]),
+                ({'a': 'b'}, {'a': 'b', 'c': 'd'}),
+                ([0, [1]], [0, [True]]),
             ):
             self.assertFalse(equal(val1, val2))
+    def test_deep(self):
+        """Test deeply nested values for equality"""
+        (val1, val2) = ([], [])
+        for _ in range(10000):
+            (val1, val2) = ([val1], [val2])
+        self.assertTrue(equal(val1, val2))
+
+class TestMemoise(TestCase):
+    """Test rsk_mt.jsonschema.validators.memoise"""
+    def setUp(self):
+        self.calls = []
+        def func(val):
+            """Record call with `val`, reject strings."""
+            self.calls.append(val)
+            if isinstance(val, str):
+                raise TypeError(f'rejected {val}')
+            return val
+        self.func = memoise(func, maxsize=2)
+    def test_scalar(self):
+        """Test scalar value outcomes are remembered"""
+        self.assertEqual(self.func(1), 1)
+        self.assertEqual(self.func(1), 1)
+        self.assertRaises(TypeError, self.func, 'a')
+        self.assertRaises(TypeError, self.func, 'a')
+        self.assertEqual(self.calls, [1, 'a'])
+    def test_error(self):
+        """Test the original error is raised, then its type and arguments"""
+        # the original error is raised from `func` (assertRaises would drop
+        # its traceback)
+        try:
+            self.func('a')
+        except TypeError as err:
+            self.assertEqual(err.args, ('rejected a',))
+            traceback = err.__traceback__
+            while traceback.tb_next:
+                traceback = traceback.tb_next
+            self.assertEqual(traceback.tb_frame.f_code.co_name, 'func')
+        else:
+            self.fail('TypeError not raised')
+        with self.assertRaises(TypeError) as context:
+            self.func('a')
+        self.assertEqual(context.exception.args, ('rejected a',))
+    def test_type(self):
+        """Test equal values of different types are not confused"""
+        self.assertIs(self.func(1), 1)
+        self.assertIs(self.func(True), True)
+        self.assertEqual(self.calls, [1, True])
+    def test_float(self):
+        """Test float values are not remembered"""
+        self.assertEqual(self.func(0.0), 0.0)
+        self.assertEqual(str(self.func(-0.0)), '-0.0')
+        self.assertEqual(self.calls, [0.0, -0.0])
+    def test_unhashable(self):
+        """Test non-scalar values are not remembered"""
+        self.assertEqual(self.func([1]), [1])
+        self.assertEqual(self.func([1]), [1])
+        self.assertEqual(self.calls, [[1], [1]])
+    def test_maxsize(self):
+        """Test the oldest outcome is forgotten"""
+        for val in (1, 2, 3, 1):
+            self.func(val)
+        self.assertEqual(self.calls, [1, 2, 3, 1])
@@ -78,6 +78,19 @@ class TestDictModelNegative(TestCase):
         """Test rsk_mt.model.DictModel rejects __call__ before model defined"""
         model = DictModel(None, 'must-understand')
         self.assertRaises(NotDefinedError, model, {})
+    def test_model_spec_read_only(self):
+        """Test rsk_mt.model.DictModel rejects model spec modification"""
+        model = DictModel({}, 'must-understand')
+        self.assertIsNone(DictModel(None, 'must-understand').model_spec)
+        with self.assertRaises(TypeError):
+            model.model_spec['k'] = {}
+    def test_model_spec_copied(self):
+        """Test rsk_mt.model.DictModel is unaffected by caller spec changes"""
+        spec = {'a': {'mandatory': True}}
+        model = DictModel(spec, 'must-understand')
+        spec['b'] = {'mandatory': True}
+        self.assertEqual(sorted(model.model_spec), ['a'])
+        self.assertEqual(model({'a': 1}), {'a': 1})
     def test_model_already_defined(self):
         """Test rsk_mt.model.DictModel rejects define when already defined"""
         model = DictModel({}, 'must-understand')
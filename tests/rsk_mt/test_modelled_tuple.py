@@ -61,6 +61,23 @@ class TestSequenceModelNegative(TestCase):
         """Test rsk_mt.model.SequenceModel rejects bad type"""
         model = SequenceModel({}, 'must-understand')
         self.assertRaises(TypeError, model, 99)
+    def test_instance_uniform_head(self):
+        """Test rsk_mt.model.SequenceModel forms a head of one value type"""
+        integer = Integer()
+        model = SequenceModel({'head': [integer, integer]}, 'must-accept')
+        self.assertEqual(model((1, 2, 'foo')), [1, 2, 'foo'])
+        self.assertRaisesRegex(TypeError, '#1', model, (1, 'bar'))
+    def test_instance_unique_unhashable(self):
+        """Test rsk_mt.model.SequenceModel checks unhashable items are unique"""
+        model = SequenceModel({'unique': True}, 'must-accept')
+        self.assertEqual(model(([1], [2])), [[1], [2]])
+        self.assertRaises(ValueError, model, ([1], [2], [1]))
+    def test_instance_too_long(self):
+        """Test rsk_mt.model.SequenceModel rejects too long before forming"""
+        model = SequenceModel(
+            {'tail': Integer(), 'length': (0, 2)}, 'must-understand',
+        )
+        self.assertRaises(ValueError, model, (1, 2, 'bad'))
 
 class _SequenceModelTestBuilder(type):
     """Build tests for rsk_mt.model.SequenceModel with specific policy.